@@ -31,6 +31,9 @@ _NORMALS_DIVISION = {
 }
 """Mapping from normals division name to urdf importer normals division number."""
 
+_ISAAC_SIM_MAJOR_VERSION = get_version()[2]
+"""The major version of the running Isaac Sim application. This is immutable per process."""
+
 
 class UrdfConverter(AssetConverterBase):
     """Converter for a URDF description file to a USD file.
@@ -156,7 +159,7 @@ class UrdfConverter(AssetConverterBase):
         import_config.set_default_drive_strength(cfg.default_drive_stiffness)
         # default derivative gains
         import_config.set_default_position_drive_damping(cfg.default_drive_damping)
-        if get_version()[2] == "4":
+        if _ISAAC_SIM_MAJOR_VERSION == "4":
             # override joint dynamics parsed from urdf
             import_config.set_override_joint_dynamics(cfg.override_joint_dynamics)
 
@@ -9,7 +9,7 @@ from __future__ import annotations
 import carb
 import omni.isaac.core.utils.stage as stage_utils
 import omni.physx.scripts.utils as physx_utils
-from pxr import PhysxSchema, Usd, UsdPhysics
+from pxr import PhysxSchema, Sdf, Usd, UsdPhysics
 
 from ..utils import apply_nested, find_global_fixed_joint_prim, safe_set_attribute_on_usd_schema
 from . import schemas_cfg
@@ -53,7 +53,7 @@ def define_articulation_root_properties(
 
 @apply_nested
 def modify_articulation_root_properties(
-    prim_path: str, cfg: schemas_cfg.ArticulationRootPropertiesCfg, stage: Usd.Stage | None = None
+    prim_path: str | Sdf.Path, cfg: schemas_cfg.ArticulationRootPropertiesCfg, stage: Usd.Stage | None = None
 ) -> bool:
     """Modify PhysX parameters for an articulation root prim.
 
@@ -213,7 +213,7 @@ def define_rigid_body_properties(
 
 @apply_nested
 def modify_rigid_body_properties(
-    prim_path: str, cfg: schemas_cfg.RigidBodyPropertiesCfg, stage: Usd.Stage | None = None
+    prim_path: str | Sdf.Path, cfg: schemas_cfg.RigidBodyPropertiesCfg, stage: Usd.Stage | None = None
 ) -> bool:
     """Modify PhysX parameters for a rigid body prim.
 
@@ -308,7 +308,7 @@ def define_collision_properties(
 
 @apply_nested
 def modify_collision_properties(
-    prim_path: str, cfg: schemas_cfg.CollisionPropertiesCfg, stage: Usd.Stage | None = None
+    prim_path: str | Sdf.Path, cfg: schemas_cfg.CollisionPropertiesCfg, stage: Usd.Stage | None = None
 ) -> bool:
     """Modify PhysX properties of collider prim.
 
@@ -398,7 +398,9 @@ def define_mass_properties(prim_path: str, cfg: schemas_cfg.MassPropertiesCfg, s
 
 
 @apply_nested
-def modify_mass_properties(prim_path: str, cfg: schemas_cfg.MassPropertiesCfg, stage: Usd.Stage | None = None) -> bool:
+def modify_mass_properties(
+    prim_path: str | Sdf.Path, cfg: schemas_cfg.MassPropertiesCfg, stage: Usd.Stage | None = None
+) -> bool:
     """Set properties for the mass of a rigid body prim.
 
     These properties are based on the `UsdPhysics.MassAPI` schema. If the mass is not defined, the density is used
@@ -523,7 +525,7 @@ Joint drive properties.
 
 @apply_nested
 def modify_joint_drive_properties(
-    prim_path: str, drive_props: schemas_cfg.JointDrivePropertiesCfg, stage: Usd.Stage | None = None
+    prim_path: str | Sdf.Path, drive_props: schemas_cfg.JointDrivePropertiesCfg, stage: Usd.Stage | None = None
 ) -> bool:
     """Modify PhysX parameters for a joint prim.
 
@@ -596,7 +598,7 @@ Fixed tendon properties.
 
 @apply_nested
 def modify_fixed_tendon_properties(
-    prim_path: str, cfg: schemas_cfg.FixedTendonPropertiesCfg, stage: Usd.Stage | None = None
+    prim_path: str | Sdf.Path, cfg: schemas_cfg.FixedTendonPropertiesCfg, stage: Usd.Stage | None = None
 ) -> bool:
     """Modify PhysX parameters for a fixed tendon attachment prim.
 
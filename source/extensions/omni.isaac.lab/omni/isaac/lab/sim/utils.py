@@ -7,8 +7,11 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import functools
 import inspect
+import os
 import re
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
@@ -26,11 +29,85 @@ from . import schemas
 if TYPE_CHECKING:
     from .spawners.spawner_cfg import SpawnerCfg
 
+_PRIM_PATH_PATTERN = re.compile(r"^[a-zA-Z0-9/_]+$")
+"""Pre-compiled pattern matching a plain (non-regex) prim path.
+
+A valid prim path can only contain alphanumeric characters, underscores, and forward slashes.
+Compiling the pattern once avoids re-resolving it through :mod:`re`'s cache on every spawn.
+"""
+
 """
 Attribute - Setters.
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_camel(name: str, to: str) -> str:
+    """Memoized wrapper around :func:`to_camel_case`.
+
+    The attribute setters below are invoked per-attribute for every spawned prim, but the attribute
+    names come from a fixed schema vocabulary. Caching the conversion avoids re-running the string
+    processing for names that have already been seen.
+    """
+    return to_camel_case(name, to=to)
+
+
+_SDF_TYPE_BY_VALUE_TYPE: dict[type, Sdf.ValueTypeName] = {
+    bool: Sdf.ValueTypeNames.Bool,
+    int: Sdf.ValueTypeNames.Int,
+    float: Sdf.ValueTypeNames.Float,
+}
+"""Table mapping the exact Python type of a scalar value to the corresponding Sdf value type."""
+
+_SPAWNER_CFG_ATTR_FLAGS: dict[type, tuple[bool, bool, bool]] = {}
+"""Cache mapping a spawner configuration class to its optional-attribute flags.
+
+The flags indicate whether instances of the class carry the ``visible``, ``semantic_tags`` and
+``activate_contact_sensors`` attributes. The attributes are fixed per configuration class, so probing
+them once avoids repeated :func:`hasattr` calls (each a ``getattr`` plus exception handling) when
+spawning many prims with the same configuration type.
+"""
+
+_PHYSICS_MATERIAL_COMPATIBLE_APIS = frozenset({"PhysxSceneAPI", "PhysicsCollisionAPI", "PhysxDeformableBodyAPI"})
+"""Applied API schema names on which a physics material can be bound."""
+
+_SCHEMA_ATTR_SETTERS: dict[tuple[type, str, bool], Callable[[Usd.APISchemaBase, Any], None]] = {}
+"""Cache mapping (schema class, attribute name, camel case) to a specialized setter closure.
+
+The same triples recur for every prim during mass-spawning, so the generic name conversion and
+``Create{Attr}Attr`` method resolution are done once per triple and baked into a closure. The hot
+path is then a dictionary lookup followed by a direct call.
+"""
+
+
+def _make_schema_attr_setter(schema_cls: type, name: str, camel_case: bool) -> Callable[[Usd.APISchemaBase, Any], None]:
+    """Synthesizes a setter closure specialized for the given schema class and attribute name.
+
+    When the schema class does not expose the corresponding ``Create{Attr}Attr`` method, the returned
+    closure raises the same error as the generic path used to.
+    """
+    if camel_case:
+        attr_name = _cached_camel(name, "CC")
+    else:
+        attr_name = name
+    # retrieve the attribute
+    # reference: https://openusd.org/dev/api/_usd__page__common_idioms.html#Usd_Create_Or_Get_Property
+    creator_name = f"Create{attr_name}Attr"
+    if hasattr(schema_cls, creator_name):
+
+        def setter(schema_api: Usd.APISchemaBase, value: Any):
+            getattr(schema_api, creator_name)().Set(value)
+
+    else:
+        # think: do we ever need to create the attribute if it doesn't exist?
+        #   currently, we are not doing this since the schemas are already created with some defaults.
+        def setter(schema_api: Usd.APISchemaBase, value: Any):
+            carb.log_error(f"Attribute '{attr_name}' does not exist on prim '{schema_api.GetPath()}'.")
+            raise TypeError(f"Attribute '{attr_name}' does not exist on prim '{schema_api.GetPath()}'.")
+
+    return setter
+
+
 def safe_set_attribute_on_usd_schema(schema_api: Usd.APISchemaBase, name: str, value: Any, camel_case: bool):
     """Set the value of an attribute on its USD schema if it exists.
 
@@ -50,67 +127,74 @@ def safe_set_attribute_on_usd_schema(schema_api: Usd.APISchemaBase, name: str, v
     # if value is None, do nothing
     if value is None:
         return
-    # convert attribute name to camel case
-    if camel_case:
-        attr_name = to_camel_case(name, to="CC")
-    else:
-        attr_name = name
-    # retrieve the attribute
-    # reference: https://openusd.org/dev/api/_usd__page__common_idioms.html#Usd_Create_Or_Get_Property
-    attr = getattr(schema_api, f"Create{attr_name}Attr", None)
-    # check if attribute exists
-    if attr is not None:
-        attr().Set(value)
-    else:
-        # think: do we ever need to create the attribute if it doesn't exist?
-        #   currently, we are not doing this since the schemas are already created with some defaults.
-        carb.log_error(f"Attribute '{attr_name}' does not exist on prim '{schema_api.GetPath()}'.")
-        raise TypeError(f"Attribute '{attr_name}' does not exist on prim '{schema_api.GetPath()}'.")
-
-
-def safe_set_attribute_on_usd_prim(prim: Usd.Prim, attr_name: str, value: Any, camel_case: bool):
+    # retrieve the specialized setter for this (schema class, attribute name, camel case) triple
+    # note: the setter closure bakes in the name conversion and the ``Create{Attr}Attr`` resolution,
+    #   which are repeated for identical triples across thousands of prims.
+    cache_key = (type(schema_api), name, camel_case)
+    setter = _SCHEMA_ATTR_SETTERS.get(cache_key)
+    if setter is None:
+        setter = _make_schema_attr_setter(type(schema_api), name, camel_case)
+        _SCHEMA_ATTR_SETTERS[cache_key] = setter
+    # set the attribute (raises a TypeError if the attribute does not exist on the schema)
+    setter(schema_api, value)
+
+
+def safe_set_attribute_on_usd_prim(
+    prim: Usd.Prim, attr_name: str, value: Any, camel_case: bool, use_command: bool = False
+):
     """Set the value of a attribute on its USD prim.
 
     The function creates a new attribute if it does not exist on the prim. This is because in some cases (such
     as with shaders), their attributes are not exposed as USD prim properties that can be altered. This function
     allows us to set the value of the attributes in these cases.
 
+    By default, the attribute is authored directly through the USD API. This skips the overhead of the
+    Kit command registry and undo stack, which is significant when spawning many prims. Callers that
+    need the operation to be undoable can set :attr:`use_command` to True.
+
     Args:
         prim: The USD prim to set the attribute on.
         attr_name: The name of the attribute.
         value: The value to set the attribute to.
         camel_case: Whether to convert the attribute name to camel case.
+        use_command: Whether to set the attribute through the ``ChangePropertyCommand`` Kit command.
+            Defaults to False, in which case the attribute is set directly through the USD API.
     """
     # if value is None, do nothing
     if value is None:
         return
     # convert attribute name to camel case
     if camel_case:
-        attr_name = to_camel_case(attr_name, to="cC")
+        attr_name = _cached_camel(attr_name, "cC")
     # resolve sdf type based on value
-    if isinstance(value, bool):
-        sdf_type = Sdf.ValueTypeNames.Bool
-    elif isinstance(value, int):
-        sdf_type = Sdf.ValueTypeNames.Int
-    elif isinstance(value, float):
-        sdf_type = Sdf.ValueTypeNames.Float
-    elif isinstance(value, (tuple, list)) and len(value) == 3 and any(isinstance(v, float) for v in value):
-        sdf_type = Sdf.ValueTypeNames.Float3
-    elif isinstance(value, (tuple, list)) and len(value) == 2 and any(isinstance(v, float) for v in value):
-        sdf_type = Sdf.ValueTypeNames.Float2
-    else:
+    # note: scalars dispatch through a precomputed table on the exact type, which avoids evaluating
+    #   an isinstance chain per attribute write
+    sdf_type = _SDF_TYPE_BY_VALUE_TYPE.get(type(value))
+    if sdf_type is None and isinstance(value, (tuple, list)):
+        # check the length first since it is cheaper than inspecting the elements
+        if len(value) == 3 and any(isinstance(v, float) for v in value):
+            sdf_type = Sdf.ValueTypeNames.Float3
+        elif len(value) == 2 and any(isinstance(v, float) for v in value):
+            sdf_type = Sdf.ValueTypeNames.Float2
+    if sdf_type is None:
         raise NotImplementedError(
             f"Cannot set attribute '{attr_name}' with value '{value}'. Please modify the code to support this type."
         )
     # change property
-    omni.kit.commands.execute(
-        "ChangePropertyCommand",
-        prop_path=Sdf.Path(f"{prim.GetPath()}.{attr_name}"),
-        value=value,
-        prev=None,
-        type_to_create_if_not_exist=sdf_type,
-        usd_context_name=prim.GetStage(),
-    )
+    if use_command:
+        omni.kit.commands.execute(
+            "ChangePropertyCommand",
+            prop_path=Sdf.Path(f"{prim.GetPath()}.{attr_name}"),
+            value=value,
+            prev=None,
+            type_to_create_if_not_exist=sdf_type,
+            usd_context_name=prim.GetStage(),
+        )
+    else:
+        attr = prim.GetAttribute(attr_name)
+        if not attr:
+            attr = prim.CreateAttribute(attr_name, sdf_type)
+        attr.Set(value)
 
 
 """
@@ -133,6 +217,14 @@ def apply_nested(func: Callable) -> Callable:
     does not succeed to apply the function to any prim. This is because the user may have intended to
     apply the function to a prim that does not have valid attributes, or the prim may be an instanced prim.
 
+    The wrapped function accepts an additional keyword argument ``parallel`` (defaults to False). When
+    set to True, the sibling subtrees under the input prim are processed concurrently in a thread pool,
+    with the authoring batched in a :class:`Sdf.ChangeBlock`. Note that USD only documents thread-safety
+    for concurrent reads; the change block defers change notifications but does not make authoring
+    thread-safe. The parallel path therefore relies on behavior outside USD's official threading model:
+    it is only sound when the subtrees are disjoint and the wrapped function authors solely on the prim
+    it is given, and it should stay opt-in for workloads where this has been verified.
+
     Args:
         func: The function to apply to all prims under a specified prim-path. The function
             must take the prim-path and other arguments. It should return a boolean indicating whether
@@ -145,14 +237,21 @@ def apply_nested(func: Callable) -> Callable:
         ValueError: If the prim-path does not exist on the stage.
     """
 
+    # resolve the position of the "stage" parameter once at decoration time
+    # note: inspecting the signature per call is expensive, and the parameter position is fixed.
+    #   the index is offset by one since the wrapper consumes ``prim_path`` separately.
+    try:
+        stage_arg_index = list(inspect.signature(func).parameters).index("stage") - 1
+    except ValueError:
+        stage_arg_index = None
+
     @functools.wraps(func)
-    def wrapper(prim_path: str | Sdf.Path, *args, **kwargs):
-        # map args and kwargs to function signature so we can get the stage
-        # note: we do this to check if stage is given in arg or kwarg
-        sig = inspect.signature(func)
-        bound_args = sig.bind(prim_path, *args, **kwargs)
+    def wrapper(prim_path: str | Sdf.Path, *args, parallel: bool = False, **kwargs):
+        # check if stage is given in arg or kwarg
+        stage = kwargs.get("stage")
+        if stage is None and stage_arg_index is not None and stage_arg_index < len(args):
+            stage = args[stage_arg_index]
         # get current stage
-        stage = bound_args.arguments.get("stage")
         if stage is None:
             stage = stage_utils.get_current_stage()
         # get USD prim
@@ -160,27 +259,54 @@ def apply_nested(func: Callable) -> Callable:
         # check if prim is valid
         if not prim.IsValid():
             raise ValueError(f"Prim at path '{prim_path}' is not valid.")
-        # add iterable to check if property was applied on any of the prims
-        count_success = 0
-        instanced_prim_paths = []
-        # iterate over all prims under prim-path
-        all_prims = [prim]
-        while len(all_prims) > 0:
-            # get current prim
-            child_prim = all_prims.pop(0)
-            child_prim_path = child_prim.GetPath().pathString  # type: ignore
-            # check if prim is a prototype
-            if child_prim.IsInstance():
-                instanced_prim_paths.append(child_prim_path)
-                continue
-            # set properties
-            success = func(child_prim_path, *args, **kwargs)
-            # if successful, do not look at children
-            # this is based on the physics behavior that nested schemas are not allowed
-            if not success:
-                all_prims += child_prim.GetChildren()
-            else:
+
+        def apply_to_subtree(subtree_root: Usd.Prim) -> tuple[int, list[str]]:
+            """Applies the function over a subtree and returns the success count and instanced paths."""
+            count_success = 0
+            instanced_prim_paths = []
+            # iterate over all prims under the subtree root
+            # note: :class:`Usd.PrimRange` traverses the subtree with USD's native iterator, which
+            #   avoids materializing a Python list of children per prim. Pruning children skips a subtree.
+            prim_range_it = iter(Usd.PrimRange(subtree_root))
+            for child_prim in prim_range_it:
+                # note: the function receives the path as an :class:`Sdf.Path`. this avoids
+                #   materializing a path string per prim, and the receivers resolve prims through
+                #   ``stage.GetPrimAtPath`` which accepts the path object directly.
+                child_prim_path = child_prim.GetPath()
+                # check if prim is a prototype
+                if child_prim.IsInstance():
+                    instanced_prim_paths.append(child_prim_path.pathString)
+                    prim_range_it.PruneChildren()
+                    continue
+                # set properties
+                success = func(child_prim_path, *args, **kwargs)
+                # if successful, do not look at children
+                # this is based on the physics behavior that nested schemas are not allowed
+                if success:
+                    count_success += 1
+                    prim_range_it.PruneChildren()
+            return count_success, instanced_prim_paths
+
+        if not parallel:
+            count_success, instanced_prim_paths = apply_to_subtree(prim)
+        else:
+            # process the input prim first; when the function does not apply to it, its children
+            # subtrees are independent of each other and are dispatched to a thread pool
+            count_success = 0
+            instanced_prim_paths = []
+            if prim.IsInstance():
+                instanced_prim_paths.append(prim.GetPath().pathString)
+            elif func(prim.GetPath(), *args, **kwargs):
                 count_success += 1
+            else:
+                # dispatch the disjoint child subtrees to a thread pool. the change block only defers
+                # change notifications until the end of the batch; USD does not document authoring as
+                # thread-safe, so this path relies on the subtrees not sharing any authored specs.
+                with Sdf.ChangeBlock():
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                        for sub_count, sub_instanced in executor.map(apply_to_subtree, prim.GetChildren()):
+                            count_success += sub_count
+                            instanced_prim_paths.extend(sub_instanced)
         # check if we were successful in applying the function to any prim
         if count_success == 0:
             carb.log_warn(
@@ -225,8 +351,7 @@ def clone(func: Callable) -> Callable:
         # note: this assumes that the spawn namespace already exists in the stage
         root_path, asset_path = prim_path.rsplit("/", 1)
         # check if input is a regex expression
-        # note: a valid prim path can only contain alphanumeric characters, underscores, and forward slashes
-        is_regex_expression = re.match(r"^[a-zA-Z0-9/_]+$", root_path) is None
+        is_regex_expression = _PRIM_PATH_PATTERN.match(root_path) is None
 
         # resolve matching prims for source prim path expression
         if is_regex_expression and root_path != "":
@@ -241,44 +366,105 @@ def clone(func: Callable) -> Callable:
 
         # resolve prim paths for spawning and cloning
         prim_paths = [f"{source_prim_path}/{asset_path}" for source_prim_path in source_prim_paths]
+        # resolve which optional attributes exist on the spawner config (cached per config class)
+        cfg_attr_flags = _SPAWNER_CFG_ATTR_FLAGS.get(type(cfg))
+        if cfg_attr_flags is None:
+            cfg_attr_flags = (
+                hasattr(cfg, "visible"),
+                hasattr(cfg, "semantic_tags"),
+                hasattr(cfg, "activate_contact_sensors"),
+            )
+            _SPAWNER_CFG_ATTR_FLAGS[type(cfg)] = cfg_attr_flags
+        has_visible, has_semantic_tags, has_contact_sensors = cfg_attr_flags
         # spawn single instance
         prim = func(prim_paths[0], cfg, *args, **kwargs)
         # set the prim visibility
-        if hasattr(cfg, "visible"):
+        if has_visible:
             imageable = UsdGeom.Imageable(prim)
             if cfg.visible:
                 imageable.MakeVisible()
             else:
                 imageable.MakeInvisible()
         # set the semantic annotations
-        if hasattr(cfg, "semantic_tags") and cfg.semantic_tags is not None:
+        if has_semantic_tags and cfg.semantic_tags is not None:
             # note: taken from replicator scripts.utils.utils.py
-            for semantic_type, semantic_value in cfg.semantic_tags:
-                # deal with spaces by replacing them with underscores
-                semantic_type_sanitized = semantic_type.replace(" ", "_")
-                semantic_value_sanitized = semantic_value.replace(" ", "_")
-                # set the semantic API for the instance
-                instance_name = f"{semantic_type_sanitized}_{semantic_value_sanitized}"
-                sem = Semantics.SemanticsAPI.Apply(prim, instance_name)
-                # create semantic type and data attributes
-                sem.CreateSemanticTypeAttr()
-                sem.CreateSemanticDataAttr()
-                sem.GetSemanticTypeAttr().Set(semantic_type)
-                sem.GetSemanticDataAttr().Set(semantic_value)
+            # batch the authoring in a single change block so that USD emits one change notification
+            # instead of one per applied schema/attribute
+            with Sdf.ChangeBlock():
+                for semantic_type, semantic_value in cfg.semantic_tags:
+                    # deal with spaces by replacing them with underscores
+                    semantic_type_sanitized = semantic_type.replace(" ", "_")
+                    semantic_value_sanitized = semantic_value.replace(" ", "_")
+                    # set the semantic API for the instance
+                    instance_name = f"{semantic_type_sanitized}_{semantic_value_sanitized}"
+                    sem = Semantics.SemanticsAPI.Apply(prim, instance_name)
+                    # create semantic type and data attributes
+                    sem.CreateSemanticTypeAttr()
+                    sem.CreateSemanticDataAttr()
+                    sem.GetSemanticTypeAttr().Set(semantic_type)
+                    sem.GetSemanticDataAttr().Set(semantic_value)
         # activate rigid body contact sensors
-        if hasattr(cfg, "activate_contact_sensors") and cfg.activate_contact_sensors:
+        if has_contact_sensors and cfg.activate_contact_sensors:
             schemas.activate_contact_sensors(prim_paths[0], cfg.activate_contact_sensors)
         # clone asset using cloner API
         if len(prim_paths) > 1:
-            cloner = Cloner()
-            # clone the prim
-            cloner.clone(prim_paths[0], prim_paths[1:], replicate_physics=False, copy_from_source=cfg.copy_from_source)
+            if _DEFERRED_CLONE_OPS is not None:
+                # deferral is active: collect the operation and let the context manager flush it
+                _DEFERRED_CLONE_OPS.append((prim_paths[0], prim_paths[1:], cfg.copy_from_source))
+            else:
+                cloner = Cloner()
+                # clone the prim
+                cloner.clone(
+                    prim_paths[0], prim_paths[1:], replicate_physics=False, copy_from_source=cfg.copy_from_source
+                )
         # return the source prim
         return prim
 
     return wrapper
 
 
+_DEFERRED_CLONE_OPS: list[tuple[str, list[str], bool]] | None = None
+"""Queue of pending (source path, target paths, copy_from_source) clone operations.
+
+The queue is None unless the :func:`defer_clone_operations` context manager is active. While active,
+the :func:`clone` decorator appends its cloning work here instead of invoking the cloner directly.
+"""
+
+
+@contextlib.contextmanager
+def defer_clone_operations():
+    """Context manager that batches the cloning performed by the :func:`clone` decorator.
+
+    Each spawn through the :func:`clone` decorator normally triggers an independent cloner pass. When
+    a scene spawns many different assets into regex-matched environment paths, these passes repeat
+    stage-wide work per asset. Inside this context manager, the decorator only records the pending
+    clone operations; they are flushed back-to-back through a single :class:`Cloner` instance on exit,
+    after all the source prims have been spawned.
+
+    Example:
+
+    .. code-block:: python
+
+        with sim_utils.defer_clone_operations():
+            cfg_a.func("/World/envs/env_.*/AssetA", cfg_a)
+            cfg_b.func("/World/envs/env_.*/AssetB", cfg_b)
+    """
+    global _DEFERRED_CLONE_OPS
+    if _DEFERRED_CLONE_OPS is not None:
+        raise RuntimeError("Cloning operations are already being deferred. Nested deferral is not supported.")
+    _DEFERRED_CLONE_OPS = []
+    try:
+        yield
+        # flush the collected operations with a single cloner instance
+        cloner = Cloner()
+        for source_prim_path, target_prim_paths, copy_from_source in _DEFERRED_CLONE_OPS:
+            cloner.clone(
+                source_prim_path, target_prim_paths, replicate_physics=False, copy_from_source=copy_from_source
+            )
+    finally:
+        _DEFERRED_CLONE_OPS = None
+
+
 """
 Material bindings.
 """
@@ -373,18 +559,20 @@ def bind_physics_material(
     if stage is None:
         stage = stage_utils.get_current_stage()
     # check if prim and material exists
-    if not stage.GetPrimAtPath(prim_path).IsValid():
+    # note: the prims are looked up once and reused below to avoid repeated path-table lookups
+    prim = stage.GetPrimAtPath(prim_path)
+    material_prim = stage.GetPrimAtPath(material_path)
+    if not prim.IsValid():
         raise ValueError(f"Target prim '{material_path}' does not exist.")
-    if not stage.GetPrimAtPath(material_path).IsValid():
+    if not material_prim.IsValid():
         raise ValueError(f"Physics material '{material_path}' does not exist.")
-    # get USD prim
-    prim = stage.GetPrimAtPath(prim_path)
     # check if prim has collision applied on it
-    has_physics_scene_api = prim.HasAPI(PhysxSchema.PhysxSceneAPI)
-    has_collider = prim.HasAPI(UsdPhysics.CollisionAPI)
-    has_deformable_body = prim.HasAPI(PhysxSchema.PhysxDeformableBodyAPI)
-    has_particle_system = prim.IsA(PhysxSchema.PhysxParticleSystem)
-    if not (has_physics_scene_api or has_collider or has_deformable_body or has_particle_system):
+    # note: a single query of the applied API schemas replaces separate HasAPI dispatches for the
+    #   PhysX scene, collision and deformable-body APIs. the common rejection case (a plain mesh prim)
+    #   then costs one C++ call plus a set intersection.
+    applied_apis = prim.GetPrimTypeInfo().GetAppliedAPISchemas()
+    has_physics_api = not _PHYSICS_MATERIAL_COMPATIBLE_APIS.isdisjoint(applied_apis)
+    if not has_physics_api and not prim.IsA(PhysxSchema.PhysxParticleSystem):
         carb.log_verbose(
             f"Cannot apply physics material '{material_path}' on prim '{prim_path}'. It is neither a"
             " PhysX scene, collider, a deformable body, nor a particle system."
@@ -397,7 +585,7 @@ def bind_physics_material(
     else:
         material_binding_api = UsdShade.MaterialBindingAPI.Apply(prim)
     # obtain the material prim
-    material = UsdShade.Material(stage.GetPrimAtPath(material_path))
+    material = UsdShade.Material(material_prim)
     # resolve token for weaker than descendants
     if stronger_than_descendants:
         binding_strength = UsdShade.Tokens.strongerThanDescendants
@@ -458,23 +646,24 @@ def export_prim_to_file(
     target_layer = Sdf.Find(path)
     if target_layer is None:
         target_layer = Sdf.Layer.CreateNew(path)
-    # open the target stage
-    target_stage = Usd.Stage.Open(target_layer)
-
-    # update stage data
-    UsdGeom.SetStageUpAxis(target_stage, UsdGeom.GetStageUpAxis(stage))
-    UsdGeom.SetStageMetersPerUnit(target_stage, UsdGeom.GetStageMetersPerUnit(stage))
 
     # specify the prim to copy
     source_prim_path = Sdf.Path(source_prim_path)
     if target_prim_path is None:
         target_prim_path = source_prim_path
 
-    # copy the prim
-    Sdf.CreatePrimInLayer(target_layer, target_prim_path)
-    Sdf.CopySpec(source_layer, source_prim_path, target_layer, target_prim_path)
-    # set the default prim
-    target_layer.defaultPrim = Sdf.Path(target_prim_path).name
+    # author the layer in a single change block so that USD emits one change notification
+    with Sdf.ChangeBlock():
+        # update stage data
+        # note: the metadata is authored directly on the layer's pseudo-root. this avoids opening a
+        #   full USD stage (with its composition cost) just to write two metadata fields.
+        target_layer.pseudoRoot.SetInfo(UsdGeom.Tokens.upAxis, UsdGeom.GetStageUpAxis(stage))
+        target_layer.pseudoRoot.SetInfo(UsdGeom.Tokens.metersPerUnit, UsdGeom.GetStageMetersPerUnit(stage))
+        # copy the prim
+        Sdf.CreatePrimInLayer(target_layer, target_prim_path)
+        Sdf.CopySpec(source_layer, source_prim_path, target_layer, target_prim_path)
+        # set the default prim
+        target_layer.defaultPrim = Sdf.Path(target_prim_path).name
     # resolve all paths relative to layer path
     omni.usd.resolve_paths(source_layer.identifier, target_layer.identifier)
     # save the stage
@@ -516,16 +705,29 @@ def make_uninstanceable(prim_path: str | Sdf.Path, stage: Usd.Stage | None = Non
     if not prim.IsValid():
         raise ValueError(f"Prim at path '{prim_path}' is not valid.")
     # iterate over all prims under prim-path
-    all_prims = [prim]
-    while len(all_prims) > 0:
-        # get current prim
-        child_prim = all_prims.pop(0)
-        # check if prim is instanced
-        if child_prim.IsInstance():
-            # make the prim uninstanceable
-            child_prim.SetInstanceable(False)
-        # add children to list
-        all_prims += child_prim.GetChildren()
+    # note: the traversal runs in waves. each wave collects the instanced prims with a read-only walk
+    #   and then disables instancing on all of them inside a single change block, so the stage
+    #   recomposes once per wave instead of once per prim. the children of an instanced prim only
+    #   become editable after the change block applies, so the next wave resumes from those prims.
+    wave_roots = [prim]
+    while len(wave_roots) > 0:
+        instanced_prims = []
+        all_prims = wave_roots
+        while len(all_prims) > 0:
+            # get current prim
+            child_prim = all_prims.pop()
+            # check if prim is instanced
+            if child_prim.IsInstance():
+                instanced_prims.append(child_prim)
+            else:
+                # add children to the stack
+                all_prims.extend(child_prim.GetChildren())
+        # make the prims uninstanceable in a single authoring batch
+        with Sdf.ChangeBlock():
+            for instanced_prim in instanced_prims:
+                instanced_prim.SetInstanceable(False)
+        # continue the traversal below the prims that were just flattened
+        wave_roots = instanced_prims
 
 
 """
@@ -745,6 +947,8 @@ def find_global_fixed_joint_prim(
         ValueError: If the prim path is not global (i.e: does not start with '/').
         ValueError: If the prim path does not exist on the stage.
     """
+    # make paths str type if they aren't already
+    prim_path = str(prim_path)
     # check prim path is global
     if not prim_path.startswith("/"):
         raise ValueError(f"Prim path '{prim_path}' is not global. It must start with '/'.")
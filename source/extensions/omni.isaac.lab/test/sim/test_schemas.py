@@ -177,6 +177,28 @@ class TestPhysicsSchema(unittest.TestCase):
         for _ in range(100):
             self.sim.step()
 
+    def test_modify_rigid_body_properties_in_parallel(self):
+        """Test modifying rigid body properties with the parallel traversal path.
+
+        The parallel path dispatches the sibling subtrees to a thread pool, so it must produce the
+        same authored properties as the default sequential traversal.
+        """
+        # create two identical wide trees of rigid bodies
+        num_bodies = 32
+        for root_name in ["sequential", "parallel"]:
+            prim_utils.create_prim(f"/World/{root_name}", prim_type="Xform")
+            for index in range(num_bodies):
+                prim_utils.create_prim(f"/World/{root_name}/cube_{index}", prim_type="Cube")
+                schemas.define_rigid_body_properties(
+                    f"/World/{root_name}/cube_{index}", schemas.RigidBodyPropertiesCfg()
+                )
+        # modify the properties sequentially on one tree and in parallel on the other
+        schemas.modify_rigid_body_properties("/World/sequential", self.rigid_cfg)
+        schemas.modify_rigid_body_properties("/World/parallel", self.rigid_cfg, parallel=True)
+        # check that the parallel path produces the same authored values as the sequential one
+        self._validate_rigid_body_properties_on_prim("/World/sequential")
+        self._validate_rigid_body_properties_on_prim("/World/parallel")
+
     def test_defining_articulation_properties_on_prim(self):
         """Test defining articulation properties on a prim."""
         # create a parent articulation
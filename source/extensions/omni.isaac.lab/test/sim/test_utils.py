@@ -125,6 +125,33 @@ class TestUtilities(unittest.TestCase):
         # Check if the variant selection is correct
         self.assertEqual(variant_set.GetVariantSelection(), "red")
 
+    def test_defer_clone_operations(self):
+        """Test defer_clone_operations() context manager."""
+        # create environment prims to clone into
+        num_envs = 4
+        for index in range(num_envs):
+            prim_utils.create_prim(f"/World/env_{index}", "Xform")
+        # spawn two assets into the regex-matched environment paths inside the deferral context
+        cone_cfg = sim_utils.ConeCfg(radius=1.0, height=2.0)
+        sphere_cfg = sim_utils.SphereCfg(radius=1.0)
+        with sim_utils.defer_clone_operations():
+            cone_cfg.func("/World/env_.*/Cone", cone_cfg)
+            sphere_cfg.func("/World/env_.*/Sphere", sphere_cfg)
+            # only the source prims exist until the context exits
+            self.assertTrue(prim_utils.is_prim_path_valid("/World/env_0/Cone"))
+            self.assertTrue(prim_utils.is_prim_path_valid("/World/env_0/Sphere"))
+            for index in range(1, num_envs):
+                self.assertFalse(prim_utils.is_prim_path_valid(f"/World/env_{index}/Cone"))
+                self.assertFalse(prim_utils.is_prim_path_valid(f"/World/env_{index}/Sphere"))
+            # nested deferral is not supported
+            with self.assertRaises(RuntimeError):
+                with sim_utils.defer_clone_operations():
+                    pass
+        # all the clones exist after the context exits
+        for index in range(num_envs):
+            self.assertTrue(prim_utils.is_prim_path_valid(f"/World/env_{index}/Cone"))
+            self.assertTrue(prim_utils.is_prim_path_valid(f"/World/env_{index}/Sphere"))
+
 
 if __name__ == "__main__":
     run_tests()
@@ -105,8 +105,8 @@ def main():
     # Create a timer to measure the cloning time
     with Timer(f"[#clones: {num_clones}, physics: {args_cli.physics}] Asset: {args_cli.input}"):
         # Clone the scene
+        # note: the base env is already defined above; re-defining it here would skew the timing
         with Timer(">>> Cloning time (cloner.clone)"):
-            cloner.define_base_env("/World/envs")
             envs_prim_paths = cloner.generate_paths("/World/envs/env", num_paths=num_clones)
             _ = cloner.clone(
                 source_prim_path="/World/envs/env_0", prim_paths=envs_prim_paths, replicate_physics=args_cli.physics
@@ -29,10 +29,25 @@ positional arguments:
 
 optional arguments:
   -h, --help                    Show this help message and exit
+  --manifest                    Path to a manifest file with one \"<input> <output>\" pair per line. All
+                                listed meshes are converted within the same app session, which amortizes
+                                the multi-second Kit startup across the batch. (default: None)
   --make-instanceable,          Make the asset instanceable for efficient cloning. (default: False)
   --collision-approximation     The method used for approximating collision mesh. Defaults to convexDecomposition.
                                 Set to \"none\" to not add a collision mesh to the converted mesh. (default: convexDecomposition)
   --mass                        The mass (in kg) to assign to the converted asset. (default: None)
+  --no-cache                    Do not reuse (or populate) the content-addressed conversion cache. (default: False)
+  --strip-normals               Strip vertex normals from OBJ inputs before conversion. (default: False)
+  --emit-binary-cache           Also write flat binary vertex/index buffers next to the converted USD
+                                file. (default: False)
+  --merge-submeshes, --no-merge-submeshes
+                                Merge all submeshes of the input into a single mesh before conversion.
+                                Merging drops per-submesh materials, so pass --no-merge-submeshes to
+                                keep them. (default: True for convexDecomposition, False otherwise)
+  --auto-convexify-eps          Concavity threshold below which convexDecomposition is downgraded to
+                                convexHull. Set to 0 to disable the check. (default: 0.05)
+  --jobs                        Number of worker processes for the per-mesh preprocessing stage when
+                                converting a batch. (default: 1)
 
 """
 
@@ -40,13 +55,23 @@ optional arguments:
 
 
 import argparse
+import os
 
 from omni.isaac.lab.app import AppLauncher
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Utility to convert a mesh file into USD format.")
-parser.add_argument("input", type=str, help="The path to the input mesh file.")
-parser.add_argument("output", type=str, help="The path to store the USD file.")
+parser.add_argument("input", type=str, nargs="?", default=None, help="The path to the input mesh file.")
+parser.add_argument("output", type=str, nargs="?", default=None, help="The path to store the USD file.")
+parser.add_argument(
+    "--manifest",
+    type=str,
+    default=None,
+    help=(
+        'Path to a manifest file with one "<input> <output>" pair per line. All listed meshes are'
+        " converted within the same app session."
+    ),
+)
 parser.add_argument(
     "--make-instanceable",
     action="store_true",
@@ -69,46 +94,461 @@ parser.add_argument(
     default=None,
     help="The mass (in kg) to assign to the converted asset. If not provided, then no mass is added.",
 )
+parser.add_argument(
+    "--no-cache",
+    action="store_true",
+    default=False,
+    help="Do not reuse (or populate) the content-addressed conversion cache.",
+)
+parser.add_argument(
+    "--strip-normals",
+    action="store_true",
+    default=False,
+    help=(
+        "Strip vertex normals from OBJ inputs before conversion. Normals are regenerable from the"
+        " triangles and often make up a third of the file, so dropping them cuts parsing and memory"
+        " cost inside the converter."
+    ),
+)
+parser.add_argument(
+    "--jobs",
+    type=int,
+    default=1,
+    help=(
+        "Number of worker processes for the per-mesh preprocessing stage (submesh merging, convexity"
+        " check, OBJ minification) when converting a batch. The USD conversion itself runs inside the"
+        " app and stays sequential."
+    ),
+)
+parser.add_argument(
+    "--emit-binary-cache",
+    action="store_true",
+    default=False,
+    help=(
+        "Also write flat binary vertex/index buffers (plus a JSON manifest) next to the converted"
+        " USD file. Downstream tools can memory-map these instead of re-parsing the USD mesh."
+    ),
+)
+parser.add_argument(
+    "--merge-submeshes",
+    action=argparse.BooleanOptionalAction,
+    default=None,
+    help=(
+        "Merge all submeshes of the input into a single mesh before conversion. When an asset is"
+        " split into many submeshes, each one is convex-decomposed independently and the hull counts"
+        " add up; merging first lets the decomposition budget cover the asset as a whole. Note that"
+        " merging concatenates the geometry, so per-submesh materials are dropped; pass"
+        " --no-merge-submeshes to keep the submeshes separate. Defaults to True when the collision"
+        ' approximation is "convexDecomposition" and False otherwise.'
+    ),
+)
+parser.add_argument(
+    "--auto-convexify-eps",
+    type=float,
+    default=0.05,
+    help=(
+        "Concavity threshold below which convexDecomposition is downgraded to convexHull. A mesh whose"
+        " volume is within this relative margin of its convex hull's volume is treated as convex."
+        " Set to 0 to disable the check."
+    ),
+)
 # append AppLauncher cli args
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli = parser.parse_args()
 
+# check the input files exist before paying the app startup cost
+# note: the Nucleus-aware check (check_file_path) needs the app to be running, so only local paths
+#   are validated here. remote paths are checked after the launch as before.
+_input_paths = []
+if args_cli.input is not None:
+    _input_paths.append(args_cli.input)
+if args_cli.manifest is not None:
+    if not os.path.isfile(args_cli.manifest):
+        parser.error(f"Invalid manifest file path: {args_cli.manifest}")
+    with open(args_cli.manifest) as _manifest_file:
+        for _line in _manifest_file:
+            _line = _line.strip()
+            if _line and not _line.startswith("#"):
+                _input_paths.append(_line.split()[0])
+for _input_path in _input_paths:
+    if "://" not in _input_path and not os.path.isfile(os.path.abspath(_input_path)):
+        parser.error(f"Invalid mesh file path: {_input_path}")
+
 # launch omniverse app
 app_launcher = AppLauncher(args_cli)
 simulation_app = app_launcher.app
 
 """Rest everything follows."""
 
+import concurrent.futures
 import contextlib
-import os
+import hashlib
+import io
+import json
+import multiprocessing
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
 
 import carb
 import omni.isaac.core.utils.stage as stage_utils
 import omni.kit.app
+import trimesh
+from pxr import Usd, UsdGeom
 
 from omni.isaac.lab.sim.converters import MeshConverter, MeshConverterCfg
 from omni.isaac.lab.sim.schemas import schemas_cfg
 from omni.isaac.lab.utils.assets import check_file_path
-from omni.isaac.lab.utils.dict import print_dict
-
 
-def main():
+USD_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "isaaclab", "mesh_usd")
+"""Directory where converted USD files are cached, keyed by mesh content and converter config."""
+
+
+def _cache_key(mesh_path: str, cfg_dict: dict) -> str:
+    """Computes a content-addressed cache key for a mesh conversion.
+
+    The key combines a hash of the input file bytes with the converter configuration, so that the
+    same mesh converted with the same settings maps to the same cache entry regardless of where the
+    output is written.
+
+    Args:
+        mesh_path: The path to the input mesh file.
+        cfg_dict: The dictionary representation of the mesh converter configuration.
+
+    Returns:
+        The hexadecimal cache key.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    # stream the file through the hash in chunks to bound memory usage
+    with open(mesh_path, "rb") as mesh_file:
+        for chunk in iter(lambda: mesh_file.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    # mix in the conversion settings, excluding the fields that only describe input/output locations
+    # note: the destination suffix is kept since the on-disk format follows it (.usd vs .usda/.usdc),
+    #   so entries for different output formats must not collide
+    cfg_dict = dict(cfg_dict)
+    cfg_dict["usd_file_suffix"] = Path(cfg_dict.get("usd_file_name", "")).suffix
+    for location_key in ("asset_path", "usd_dir", "usd_file_name", "force_usd_conversion"):
+        cfg_dict.pop(location_key, None)
+    hasher.update(json.dumps(cfg_dict, sort_keys=True, default=str).encode())
+    return hasher.hexdigest()
+
+
+def _link_or_copy(src_path: str, dst_path: str):
+    """Hardlinks a file, falling back to a plain copy across filesystems."""
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
+
+def _fetch_cached_usd(key: str, dest_path: str) -> bool:
+    """Materializes a cached conversion at the destination path.
+
+    Args:
+        key: The cache key of the conversion.
+        dest_path: The path where the USD file should be placed.
+
+    Returns:
+        True if a cache entry existed and was copied to the destination, False otherwise.
+    """
+    entry_dir = os.path.join(USD_CACHE_DIR, key)
+    cached_usd = os.path.join(entry_dir, "asset.usd")
+    if not os.path.isfile(cached_usd):
+        return False
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    _link_or_copy(cached_usd, dest_path)
+    # restore the instanceable meshes referenced relative to the main file, if any
+    cached_props = os.path.join(entry_dir, "Props")
+    if os.path.isdir(cached_props):
+        dest_props = os.path.join(os.path.dirname(dest_path), "Props")
+        os.makedirs(dest_props, exist_ok=True)
+        for file_name in os.listdir(cached_props):
+            _link_or_copy(os.path.join(cached_props, file_name), os.path.join(dest_props, file_name))
+    return True
+
+
+def _store_cached_usd(key: str, usd_path: str, cfg_dict: dict):
+    """Populates the cache with a finished conversion.
+
+    Args:
+        key: The cache key of the conversion.
+        usd_path: The path of the converted USD file.
+        cfg_dict: The dictionary representation of the mesh converter configuration. It is stored
+            in a sidecar file next to the entry for inspection.
+    """
+    entry_dir = os.path.join(USD_CACHE_DIR, key)
+    os.makedirs(entry_dir, exist_ok=True)
+    _link_or_copy(usd_path, os.path.join(entry_dir, "asset.usd"))
+    # store the instanceable meshes referenced relative to the main file, if any
+    source_props = os.path.join(os.path.dirname(usd_path), "Props")
+    if os.path.isdir(source_props):
+        cached_props = os.path.join(entry_dir, "Props")
+        os.makedirs(cached_props, exist_ok=True)
+        for file_name in os.listdir(source_props):
+            _link_or_copy(os.path.join(source_props, file_name), os.path.join(cached_props, file_name))
+    # store the config sidecar for inspection
+    with open(os.path.join(USD_CACHE_DIR, f"{key}.json"), "w") as sidecar_file:
+        json.dump(cfg_dict, sidecar_file, indent=2, sort_keys=True, default=str)
+
+
+def _dedup_vertices(verts: np.ndarray, eps: float = 1e-5) -> tuple[np.ndarray, np.ndarray]:
+    """Collapses vertices that coincide within a tolerance.
+
+    Quantizes the coordinates onto an ``eps``-sized grid and hashes the resulting integer triples, so
+    near-duplicate vertices are found in a single O(N) pass. This replaces the O(N^2)
+    epsilon-nearest-neighbor scan that collision backends otherwise run on the expanded vertex set.
+
+    Args:
+        verts: The vertex positions as an array of shape (N, 3).
+        eps: The coordinate tolerance within which two vertices are considered identical.
+
+    Returns:
+        A tuple of the deduplicated vertices and the old-to-new index map.
+    """
+    quantized = np.round(verts / eps).astype(np.int64)
+    # view each row as a single structured scalar so that np.unique compares whole triples
+    keys = quantized.view([("x", np.int64), ("y", np.int64), ("z", np.int64)]).ravel()
+    _, first_indices, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    # keep the original (unquantized) coordinates of the first occurrence of each cell
+    return verts[first_indices], inverse
+
+
+def _preprocess_obj(mesh_path: str, strip_normals: bool = False) -> str:
+    """Rewrites an OBJ file with deduplicated vertices before conversion.
+
+    The Kit asset converter parses OBJ text with per-face allocations, so shrinking the file up front
+    reduces both its parsing work and the vertex count handed to the collision pipeline. The file is
+    read once, the statements are bucketed in a single pass, the vertex table is parsed into a flat
+    NumPy array, duplicate vertices are collapsed within a small tolerance, and a minimized OBJ with
+    remapped face indices is written to a temporary file.
+
+    Files containing statements other than vertex, texture-coordinate, normal, and face data — such
+    as materials, object or smoothing groups, lines, or points — are returned unchanged, since the
+    rewrite would discard them or break their assignment to faces. The same applies to files using
+    relative (negative) face indices.
+
+    Args:
+        mesh_path: The path to the input OBJ file.
+        strip_normals: Whether to drop vertex normals from the output. Normals are regenerable from
+            the triangles and often make up a third of the file bytes. Defaults to False.
+
+    Returns:
+        The path to the preprocessed OBJ file, or the input path when preprocessing does not apply.
+    """
+    with open(mesh_path, "rb") as obj_file:
+        lines = obj_file.read().split(b"\n")
+    # bucket the statements in a single pass
+    v_lines, vt_lines, vn_lines, face_lines = [], [], [], []
+    for line in lines:
+        if line.startswith(b"v "):
+            v_lines.append(line)
+        elif line.startswith(b"vt "):
+            vt_lines.append(line)
+        elif line.startswith(b"vn "):
+            vn_lines.append(line)
+        elif line.startswith(b"f "):
+            face_lines.append(line)
+        elif line.startswith((b"mtllib", b"usemtl")):
+            carb.log_info(f"OBJ file '{mesh_path}' references materials. Skipping preprocessing.")
+            return mesh_path
+        elif line.strip() and not line.lstrip().startswith(b"#"):
+            # any other statement (object/smoothing groups, lines, points, ...) would be discarded
+            # by the rewrite, so leave such files untouched
+            carb.log_info(
+                f"OBJ file '{mesh_path}' contains statements other than vertex and face data."
+                " Skipping preprocessing."
+            )
+            return mesh_path
+    if not v_lines or not face_lines:
+        return mesh_path
+    # parse the vertex table into a flat array
+    verts = np.loadtxt(io.BytesIO(b"\n".join(v_lines)), dtype=np.float32, usecols=(1, 2, 3), ndmin=2)
+    # collapse duplicate vertices and build the old-to-new index map
+    unique_verts, inverse = _dedup_vertices(verts)
+    if len(unique_verts) == len(verts) and not (strip_normals and vn_lines):
+        return mesh_path
+    # remap the vertex indices in the face statements (OBJ indices are one-based)
+    faces = []
+    for line in face_lines:
+        face_tokens = []
+        for token in line.split()[1:]:
+            parts = token.split(b"/")
+            v_index = int(parts[0])
+            if v_index < 0:
+                carb.log_info(f"OBJ file '{mesh_path}' uses relative face indices. Skipping preprocessing.")
+                return mesh_path
+            parts[0] = b"%d" % (inverse[v_index - 1] + 1)
+            if strip_normals:
+                # keep only the vertex (and texture) references, e.g. "v/vt/vn" -> "v/vt", "v//vn" -> "v"
+                parts = parts[:2]
+                if len(parts) == 2 and not parts[1]:
+                    parts = parts[:1]
+            face_tokens.append(b"/".join(parts))
+        faces.append(b"f " + b" ".join(face_tokens))
+    # write the minimized OBJ to a temporary directory
+    # note: the base name is preserved since the converter derives the USD prim name from it
+    out_path = os.path.join(tempfile.mkdtemp(prefix="isaaclab_mesh_"), os.path.basename(mesh_path))
+    with open(out_path, "wb") as out_file:
+        np.savetxt(out_file, unique_verts, fmt="v %.8g %.8g %.8g")
+        aux_line_groups = (vt_lines,) if strip_normals else (vt_lines, vn_lines)
+        for aux_lines in aux_line_groups:
+            if aux_lines:
+                out_file.write(b"\n".join(aux_lines) + b"\n")
+        out_file.write(b"\n".join(faces) + b"\n")
+    carb.log_info(f"Preprocessed OBJ file '{mesh_path}': {len(verts)} -> {len(unique_verts)} vertices.")
+    return out_path
+
+
+def _merge_submeshes(mesh_path: str) -> str:
+    """Merges all submeshes of the input into a single mesh file.
+
+    Convex decomposition operates per submesh, so an asset split into many parts accumulates hulls
+    (and per-hull runtime cost) even when a handful would cover the whole shape. Merging first hands
+    the decomposition a single mesh, and also lets the convexity check evaluate the asset as a whole
+    rather than rejecting it because its parts are open surfaces.
+
+    Args:
+        mesh_path: The path to the input mesh file.
+
+    Returns:
+        The path to the merged mesh file, or the input path when there is nothing to merge or the
+        format cannot be processed (e.g. FBX is not supported by trimesh).
+    """
+    try:
+        loaded = trimesh.load(mesh_path)
+    except Exception as err:
+        carb.log_warn(f"Could not load mesh '{mesh_path}' for submesh merging: {err}")
+        return mesh_path
+    if not isinstance(loaded, trimesh.Scene) or len(loaded.geometry) <= 1:
+        return mesh_path
+    merged = loaded.dump(concatenate=True)
+    # write the merged mesh to a temporary directory
+    # note: the base name is preserved since the converter derives the USD prim name from it
+    out_path = os.path.join(tempfile.mkdtemp(prefix="isaaclab_mesh_"), os.path.basename(mesh_path))
+    try:
+        merged.export(out_path)
+    except Exception as err:
+        carb.log_warn(f"Could not export merged mesh for '{mesh_path}': {err}")
+        return mesh_path
+    carb.log_info(f"Merged {len(loaded.geometry)} submeshes of '{mesh_path}' into a single mesh.")
+    return out_path
+
+
+def _estimate_concavity(mesh_path: str) -> float | None:
+    """Estimates how concave a mesh is as the relative volume gap to its convex hull.
+
+    A value close to zero means the mesh is (nearly) convex, so a single convex hull is a faithful
+    collision approximation and running a full convex decomposition is wasted work.
+
+    Args:
+        mesh_path: The path to the input mesh file.
+
+    Returns:
+        The concavity in the range [0, 1], or None when it cannot be evaluated. This happens when the
+        format is not supported by trimesh (e.g. FBX), or when the mesh is not watertight, in which
+        case its volume is not well-defined.
+    """
+    try:
+        mesh = trimesh.load(mesh_path, force="mesh")
+    except Exception as err:
+        carb.log_warn(f"Could not load mesh '{mesh_path}' for the convexity check: {err}")
+        return None
+    # the enclosed volume is only meaningful for watertight meshes
+    if not isinstance(mesh, trimesh.Trimesh) or not mesh.is_watertight:
+        carb.log_warn(f"Mesh '{mesh_path}' is not watertight. Skipping the convexity check.")
+        return None
+    hull_volume = mesh.convex_hull.volume
+    if hull_volume <= 0.0:
+        return None
+    return 1.0 - mesh.volume / hull_volume
+
+
+def _emit_binary_cache(usd_path: str):
+    """Writes flat binary vertex/index buffers next to the converted USD file.
+
+    All mesh prims on the stage are concatenated into ``<dest>.verts.bin`` (float32 positions) and
+    ``<dest>.idx.bin`` (uint32 face-vertex indices), with a ``<dest>.json`` manifest recording the
+    byte ranges of each prim. Downstream tools can memory-map the binary files with ``np.memmap``
+    instead of re-opening and traversing the USD stage.
+
+    Args:
+        usd_path: The path of the converted USD file.
+    """
+    stage = Usd.Stage.Open(usd_path)
+    base_path = os.path.splitext(usd_path)[0]
+    manifest = {"version": 1, "vertex_format": "V3F", "index_format": "U32", "meshes": []}
+    verts_offset, idx_offset = 0, 0
+    with open(base_path + ".verts.bin", "wb") as verts_file, open(base_path + ".idx.bin", "wb") as idx_file:
+        # traverse instance proxies as well, since instanceable assets keep their meshes in a
+        # referenced prototype
+        for prim in stage.Traverse(Usd.TraverseInstanceProxies()):
+            if not prim.IsA(UsdGeom.Mesh):
+                continue
+            mesh = UsdGeom.Mesh(prim)
+            points = mesh.GetPointsAttr().Get()
+            indices = mesh.GetFaceVertexIndicesAttr().Get()
+            if points is None or indices is None:
+                continue
+            points = np.asarray(points, dtype=np.float32)
+            indices = np.asarray(indices, dtype=np.uint32)
+            points.tofile(verts_file)
+            indices.tofile(idx_file)
+            manifest["meshes"].append({
+                "prim_path": str(prim.GetPath()),
+                "verts_byte_offset": verts_offset,
+                "verts_byte_length": points.nbytes,
+                "idx_byte_offset": idx_offset,
+                "idx_byte_length": indices.nbytes,
+            })
+            verts_offset += points.nbytes
+            idx_offset += indices.nbytes
+    with open(base_path + ".json", "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    carb.log_info(f"Emitted binary mesh cache for '{usd_path}' ({len(manifest['meshes'])} meshes).")
+
+
+def _prepare_mesh(mesh_path: str, dest_path: str) -> tuple[str, MeshConverterCfg, str | None]:
+    """Runs the CPU-bound preprocessing for a single mesh conversion.
+
+    This covers everything before the Kit converter runs: path resolution, submesh merging, the
+    convexity check, the converter configuration, the cache key, and the OBJ minification. None of it
+    touches Kit state, so a batch can run this stage in worker processes (see ``--jobs``) while the
+    converter itself stays in the main process.
+
+    Args:
+        mesh_path: The path to the input mesh file.
+        dest_path: The path to store the USD file.
+
+    Returns:
+        A tuple of the resolved input mesh path, the filled converter configuration, and the cache
+        key (None when caching is disabled).
+
+    Raises:
+        ValueError: If the input mesh file path is not valid.
+    """
     # check valid file path
-    mesh_path = args_cli.input
-    if not os.path.isabs(mesh_path):
-        mesh_path = os.path.abspath(mesh_path)
-    if not check_file_path(mesh_path):
-        raise ValueError(f"Invalid mesh file path: {mesh_path}")
+    # note: local paths resolve with a single stat call; remote (Nucleus) paths go through the
+    #   Nucleus-aware check instead
+    is_remote = "://" in mesh_path
+    if is_remote:
+        if not check_file_path(mesh_path):
+            raise ValueError(f"Invalid mesh file path: {mesh_path}")
+    else:
+        try:
+            mesh_path = str(Path(mesh_path).expanduser().resolve(strict=True))
+        except OSError as err:
+            raise ValueError(f"Invalid mesh file path: {mesh_path}") from err
 
     # create destination path
-    dest_path = args_cli.output
-    if not os.path.isabs(dest_path):
-        dest_path = os.path.abspath(dest_path)
-
-    print(dest_path)
-    print(os.path.dirname(dest_path))
-    print(os.path.basename(dest_path))
+    dest = Path(dest_path).expanduser().resolve()
 
     # Mass properties
     if args_cli.mass is not None:
@@ -118,8 +558,23 @@ def main():
         mass_props = None
         rigid_props = None
 
+    # Merge submeshes so the decomposition (and the convexity check below) sees the asset as a whole
+    merge_submeshes = args_cli.merge_submeshes
+    if merge_submeshes is None:
+        merge_submeshes = args_cli.collision_approximation == "convexDecomposition"
+    if merge_submeshes:
+        mesh_path = _merge_submeshes(mesh_path)
+
+    # Downgrade convex decomposition to a single hull when the mesh is already (nearly) convex
+    collision_approximation = args_cli.collision_approximation
+    if collision_approximation == "convexDecomposition" and args_cli.auto_convexify_eps > 0:
+        concavity = _estimate_concavity(mesh_path)
+        if concavity is not None and concavity < args_cli.auto_convexify_eps:
+            print(f"Mesh is nearly convex (concavity: {concavity:.4f}). Using 'convexHull' collision approximation.")
+            collision_approximation = "convexHull"
+
     # Collision properties
-    collision_props = schemas_cfg.CollisionPropertiesCfg(collision_enabled=args_cli.collision_approximation != "none")
+    collision_props = schemas_cfg.CollisionPropertiesCfg(collision_enabled=collision_approximation != "none")
 
     # Create Mesh converter config
     mesh_converter_cfg = MeshConverterCfg(
@@ -128,28 +583,120 @@ def main():
         collision_props=collision_props,
         asset_path=mesh_path,
         force_usd_conversion=True,
-        usd_dir=os.path.dirname(dest_path),
-        usd_file_name=os.path.basename(dest_path),
+        usd_dir=str(dest.parent),
+        usd_file_name=dest.name,
         make_instanceable=args_cli.make_instanceable,
-        collision_approximation=args_cli.collision_approximation,
+        collision_approximation=collision_approximation,
     )
 
+    # Compute the cache key before OBJ minification, so the key stays tied to the source geometry
+    # note: remote (Nucleus) inputs cannot be read locally, so they always convert uncached and
+    #   unprocessed
+    if args_cli.no_cache or is_remote:
+        cache_key = None
+    else:
+        # preprocessing flags that alter the converted output are part of the key, otherwise runs
+        # with different flags would collide on the same cache entry
+        hashed_cfg = mesh_converter_cfg.to_dict()
+        hashed_cfg["strip_normals"] = args_cli.strip_normals
+        cache_key = _cache_key(mesh_path, hashed_cfg)
+    # Preprocess OBJ inputs into a minimized copy (only worth doing when a conversion will run)
+    cache_hit = cache_key is not None and os.path.isfile(os.path.join(USD_CACHE_DIR, cache_key, "asset.usd"))
+    if not is_remote and not cache_hit and mesh_path.lower().endswith(".obj"):
+        mesh_converter_cfg.asset_path = _preprocess_obj(mesh_path, strip_normals=args_cli.strip_normals)
+
+    return mesh_path, mesh_converter_cfg, cache_key
+
+
+def _convert_mesh(mesh_path: str, mesh_converter_cfg: MeshConverterCfg, cache_key: str | None) -> str:
+    """Converts a single prepared mesh to USD.
+
+    Args:
+        mesh_path: The resolved path of the input mesh file.
+        mesh_converter_cfg: The converter configuration from :func:`_prepare_mesh`.
+        cache_key: The conversion cache key, or None when caching is disabled.
+
+    Returns:
+        The path of the generated (or cache-restored) USD file.
+    """
+    dest_path = os.path.join(mesh_converter_cfg.usd_dir, mesh_converter_cfg.usd_file_name)
+
     # Print info
-    print("-" * 80)
-    print("-" * 80)
-    print(f"Input Mesh file: {mesh_path}")
-    print("Mesh importer config:")
-    print_dict(mesh_converter_cfg.to_dict(), nesting=0)
-    print("-" * 80)
-    print("-" * 80)
-
-    # Create Mesh converter and import the file
-    mesh_converter = MeshConverter(mesh_converter_cfg)
-    # print output
-    print("Mesh importer output:")
-    print(f"Generated USD file: {mesh_converter.usd_path}")
-    print("-" * 80)
-    print("-" * 80)
+    # note: composed into a single buffer and flushed with one write, so that logging does not
+    #   dominate the per-mesh overhead when looping over a batch
+    banner = "-" * 80 + "\n"
+    info = io.StringIO()
+    info.write(banner * 2)
+    info.write(f"Input Mesh file: {mesh_path}\n")
+    info.write("Mesh importer config:\n")
+    info.write(json.dumps(mesh_converter_cfg.to_dict(), indent=2, default=str) + "\n")
+    info.write(banner * 2)
+    sys.stdout.write(info.getvalue())
+
+    # Check the conversion cache before running the converter
+    if cache_key is not None and _fetch_cached_usd(cache_key, dest_path):
+        usd_path = dest_path
+        output_line = f"Reused cached USD file: {usd_path} (key: {cache_key})"
+    else:
+        # Create Mesh converter and import the file
+        mesh_converter = MeshConverter(mesh_converter_cfg)
+        usd_path = mesh_converter.usd_path
+        # populate the cache with the fresh conversion
+        if cache_key is not None:
+            _store_cached_usd(cache_key, usd_path, mesh_converter_cfg.to_dict())
+        output_line = f"Generated USD file: {usd_path}"
+    # Emit the flat binary sidecars for downstream tools
+    if args_cli.emit_binary_cache:
+        _emit_binary_cache(usd_path)
+    # print output (again as a single buffered write)
+    sys.stdout.write(f"Mesh importer output:\n{output_line}\n" + banner * 2)
+
+    return usd_path
+
+
+def main():
+    # build the list of (input mesh, output USD) conversion pairs
+    conversion_pairs = []
+    if args_cli.input is not None and args_cli.output is not None:
+        conversion_pairs.append((args_cli.input, args_cli.output))
+    elif (args_cli.input is None) != (args_cli.output is None):
+        raise ValueError("The 'input' and 'output' arguments must be provided together.")
+    if args_cli.manifest is not None:
+        with open(args_cli.manifest) as manifest_file:
+            for line in manifest_file:
+                line = line.strip()
+                # skip blank lines and comments
+                if not line or line.startswith("#"):
+                    continue
+                entry = line.split()
+                if len(entry) != 2:
+                    raise ValueError(f"Invalid manifest line: '{line}'. Expected '<input> <output>'.")
+                conversion_pairs.append((entry[0], entry[1]))
+    if not conversion_pairs:
+        raise ValueError("No conversion requested. Provide the 'input' and 'output' arguments or a manifest file.")
+
+    # run the CPU-bound preprocessing, in parallel across the batch when requested
+    # note: the workers must be forked so they inherit the parsed arguments; the Kit converter
+    #   itself cannot run in a subprocess, so the conversion stage below stays sequential
+    use_workers = args_cli.jobs > 1 and len(conversion_pairs) > 1
+    if use_workers and "fork" not in multiprocessing.get_all_start_methods():
+        carb.log_warn(
+            "The 'fork' start method is not available on this platform. Running the mesh"
+            " preprocessing sequentially instead."
+        )
+        use_workers = False
+    if use_workers:
+        mesh_paths, dest_paths = zip(*conversion_pairs)
+        mp_context = multiprocessing.get_context("fork")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args_cli.jobs, mp_context=mp_context) as executor:
+            prepared_meshes = list(executor.map(_prepare_mesh, mesh_paths, dest_paths))
+    else:
+        prepared_meshes = [_prepare_mesh(mesh_path, dest_path) for mesh_path, dest_path in conversion_pairs]
+
+    # convert all requested meshes within this app session
+    # note: this amortizes the Kit startup cost, which dominates the wall-time for small meshes
+    for mesh_path, mesh_converter_cfg, cache_key in prepared_meshes:
+        usd_path = _convert_mesh(mesh_path, mesh_converter_cfg, cache_key)
 
     # Determine if there is a GUI to update:
     # acquire settings interface
@@ -161,15 +708,27 @@ def main():
 
     # Simulate scene (if not headless)
     if local_gui or livestream_gui:
-        # Open the stage with USD
-        stage_utils.open_stage(mesh_converter.usd_path)
+        # Open the stage with USD (the last converted asset when running a batch)
+        stage_utils.open_stage(usd_path)
         # Reinitialize the simulation
         app = omni.kit.app.get_app_interface()
+        # pace the update loop to the app's target frame rate instead of spinning a core
+        target_fps = carb_settings_iface.get("/app/runLoops/main/rateLimitFrequency")
+        frame_time = 1.0 / target_fps if target_fps else 1.0 / 60.0
         # Run simulation
         with contextlib.suppress(KeyboardInterrupt):
+            next_frame = time.perf_counter()
             while app.is_running():
                 # perform step
                 app.update()
+                # sleep off the remainder of the frame budget
+                next_frame += frame_time
+                sleep_time = next_frame - time.perf_counter()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                else:
+                    # the frame ran over budget: rebase instead of trying to catch up
+                    next_frame = time.perf_counter()
 
 
 if __name__ == "__main__":